@@ -14,6 +14,8 @@ class BinaryTree:
     Each node stores a value and references to its left and right children.
     Leaf nodes represent actual values used in the decoded_sequence output.
     """
+    __slots__ = ('_value', '_left', '_right')
+
     def __init__(self, value):
         """
         Initializes a BinaryTree node.
@@ -39,12 +41,19 @@ def build_tree(preorder, inorder):
 
     if not preorder or not inorder:
         return None
-    root_val = preorder[0]
-    root = BinaryTree(root_val)
-    mid_index = inorder.index(root_val)
-    root._left = build_tree(preorder[1:1+mid_index], inorder[:mid_index])
-    root._right = build_tree(preorder[1+mid_index:], inorder[mid_index+1:])
-    return root
+    inorder_index = {value: i for i, value in enumerate(inorder)}
+    pre_iter = iter(preorder)
+
+    def build(low, high):
+        if low >= high:
+            return None
+        root = BinaryTree(next(pre_iter))
+        mid_index = inorder_index[root._value]
+        root._left = build(low, mid_index)
+        root._right = build(mid_index + 1, high)
+        return root
+
+    return build(0, len(inorder))
 
 def postorder_traversal(root):
     """
@@ -56,11 +65,19 @@ def postorder_traversal(root):
     Returns:
         list: A list of integers representing the postorder traversal.
     """
-    if root is None:
-        return []
-    return (postorder_traversal(root._left) + 
-            postorder_traversal(root._right) + 
-            [root._value])
+    order = []
+    stack = [(root, False)]
+    while stack:
+        node, visited = stack.pop()
+        if node is None:
+            continue
+        if visited:
+            order.append(node._value)
+        else:
+            stack.append((node, True))
+            stack.append((node._right, False))
+            stack.append((node._left, False))
+    return order
 
 def read_input_file():
     """
@@ -71,18 +88,85 @@ def read_input_file():
     and the encoded binary string.
     """
     fname = input("Input file: ")
-    file = open(fname,"r")
-    preorder = []
-    for i in file.readline().split():
-        preorder.append(int(i))
-    inorder = []
-    for j in file.readline().split():
-        inorder.append(int(j))
-    
-    binary_string = file.readline().strip()
-    file.close()
+    with open(fname, "r") as file:
+        preorder = list(map(int, file.readline().split()))
+        inorder = list(map(int, file.readline().split()))
+        binary_string = file.readline().strip()
     return preorder, inorder, binary_string
 
+def flatten_tree(root):
+    """
+    Flattens the binary tree into parallel arrays indexed by node id.
+
+    Node ids are assigned breadth-first with the root at id 0, so the
+    decode loop can follow integer indices instead of chasing node
+    objects and their attributes.
+
+    Parameters:
+        root (BinaryTree): The root of the decoding binary tree.
+
+    Returns:
+        tuple: (nexts, value, is_leaf) where nexts[2*i] and
+        nexts[2*i + 1] hold node i's left and right child ids (-1 for
+        no child), value holds each node's value, and is_leaf marks
+        the leaf nodes.
+    """
+    nodes = [root]
+    for node in nodes:
+        if node._left is not None:
+            nodes.append(node._left)
+        if node._right is not None:
+            nodes.append(node._right)
+    node_id = {id(node): i for i, node in enumerate(nodes)}
+    count = len(nodes)
+    nexts = [-1] * (2 * count)
+    value = [None] * count
+    is_leaf = bytearray(count)
+    for i, node in enumerate(nodes):
+        value[i] = node._value
+        if node._left is not None:
+            nexts[2 * i] = node_id[id(node._left)]
+        if node._right is not None:
+            nexts[2 * i + 1] = node_id[id(node._right)]
+        if node._left is None and node._right is None:
+            is_leaf[i] = 1
+    return nexts, value, is_leaf
+
+def build_decode_table(nexts, value, is_leaf):
+    """
+    Precomputes a byte-wise decoding table for the flattened tree.
+
+    For every non-leaf state and every possible 8-bit chunk, the table
+    records where the walk ends up and which values it emits along the
+    way, so the decoder can consume the input a byte at a time instead
+    of a bit at a time.
+
+    Parameters:
+        nexts (list): Flat child table from flatten_tree.
+        value (list): Node values from flatten_tree.
+        is_leaf (bytearray): Leaf flags from flatten_tree.
+
+    Returns:
+        list: table where table[state][byte] is a (next_state, emitted)
+        pair, with emitted being the decoded values as one string.
+    """
+    table = [None] * len(is_leaf)
+    for state in range(len(is_leaf)):
+        if is_leaf[state]:
+            continue
+        row = []
+        for byte in range(256):
+            i = state
+            emitted = []
+            for shift in range(7, -1, -1):
+                i = nexts[(i << 1) | ((byte >> shift) & 1)]
+                if is_leaf[i]:
+                    emitted.append(str(value[i]))
+                    i = 0
+            row.append((i, ''.join(emitted)))
+        table[state] = row
+    return table
+
 def decode_huffman(binary_string, root):
     """
     Decodes a Huffman-encoded binary string using a binary tree.
@@ -96,17 +180,23 @@ def decode_huffman(binary_string, root):
     Returns:
         str: A string of decoded_sequence leaf values concatenated together.
     """
-    decoded_sequence = ""
-    node = root
-    for num in binary_string:
-        if num == "0":
-            node = node._left
-        else:
-            node = node._right
-        if node and not node._left and not node._right:
-            decoded_sequence += str(node._value)
-            node = root
-    return decoded_sequence
+    nexts, value, is_leaf = flatten_tree(root)
+    table = build_decode_table(nexts, value, is_leaf)
+    decoded_sequence = []
+    emit = decoded_sequence.append
+    to_int = int
+    state = 0
+    full = len(binary_string) - len(binary_string) % 8
+    for pos in range(0, full, 8):
+        state, emitted = table[state][to_int(binary_string[pos:pos + 8], 2)]
+        if emitted:
+            emit(emitted)
+    for num in binary_string[full:].encode():
+        state = nexts[(state << 1) | (num & 1)]
+        if is_leaf[state]:
+            emit(str(value[state]))
+            state = 0
+    return ''.join(decoded_sequence)
 
 def main():
     """
@@ -115,9 +205,7 @@ def main():
     """
     preorder, inorder, binary_string = read_input_file()
     root = build_tree(preorder, inorder)
-    post_order_concat = ""
-    for i in postorder_traversal(root):
-        post_order_concat += str(i) + " "
+    post_order_concat = ' '.join(map(str, postorder_traversal(root)))
     print(post_order_concat)
     print(decode_huffman(binary_string, root))
 
@@ -1,14 +1,18 @@
 import sys
-from random import seed, randint
+from collections import defaultdict, deque
+from random import seed, randrange
 SEED = 8
 seed(SEED)
 NONWORD = '@'
 
 '''
 Purpose: This program generates random text based on a source file
-         using a Markov Chain algorithm and a custom Hash Table ADT.
-         It uses a specified prefix size and generates a desired number
-         of words, while handling collisions with linear probing.
+         using a Markov Chain algorithm. It uses a specified prefix
+         size and generates a desired number of words. The prefix to
+         suffix mapping uses the built-in dict, whose C-level hashing
+         and lookup are far faster than the Python-level probing of
+         the Hashtable ADT (kept below with linear probing collision
+         handling).
 '''
 
 
@@ -41,6 +45,8 @@ class Hashtable:
     def put(self, key, value):
         '''
         Inserts a key and value into the hash table using linear probing.
+        If the key is already present, the value is appended to its
+        existing value list instead of occupying a new slot.
 
         Parameters:
             key (str): The key to insert into the hash table.
@@ -50,13 +56,11 @@ class Hashtable:
             None
         '''
         i = self._hash(key)
-        if self._pairs[i] != None:
-            while True:
-                i -= 1 
-                if i < 0:
-                    i = len(self._pairs) - 1 
-                if self._pairs[i] == None:
-                    break
+        while self._pairs[i] is not None:
+            if self._pairs[i][0] == key:
+                self._pairs[i][1].append(value)
+                return
+            i = (i - 1) % self._size
         self._pairs[i] = [key, [value]]
 
     def get(self, key):
@@ -109,14 +113,8 @@ def read_file(filename):
     Returns:
         content (list): A list of words from the file.
     '''
-    info = open(filename, 'r')
-    content = []
-    for line in info:
-        line = line.strip().split()
-        for words in line:
-            content.append(words)
-    info.close()
-    return content
+    with open(filename, 'r') as info:
+        return info.read().split()
 
 def build_prefix_suffix_table(contents, n, table_size):
     '''
@@ -125,52 +123,64 @@ def build_prefix_suffix_table(contents, n, table_size):
     Parameters:
         contents (list): A list of words from the input file.
         n (int): The prefix size (number of words in a prefix).
-        table_size (int): The size of the hash table.
+        table_size (int): The size of the hash table (unused with the
+                          built-in dict; kept for the input format).
 
     Returns:
-        Hashtable: The populated hash table containing prefixes as keys
-                   and lists of possible suffixes as values.
+        tuple: (table, id_to_word) where table maps prefix id tuples
+        to lists of suffix ids and id_to_word maps each id back to
+        its word. Words are interned to small ints (NONWORD is id 0)
+        so keys hash as short integer tuples instead of strings.
     '''
-    table = Hashtable(table_size)
-    prefix = [NONWORD] * n
+    table = defaultdict(list)
+    word_id = {NONWORD: 0}
+    id_to_word = [NONWORD]
+    prefix = deque([0] * n, maxlen=n)
+    get_id = word_id.get
+    push = prefix.append
+    to_tuple = tuple
     for word in contents:
-        prefix_str = ' '.join(prefix)
-        if prefix_str in table:
-            table.get(prefix_str).append(word)
-        else:
-            table.put(prefix_str, word)
-        prefix.pop(0)
-        prefix.append(word)
-    return table
-
-def generate_text(table, n, word_count):
+        wid = get_id(word)
+        if wid is None:
+            wid = len(id_to_word)
+            word_id[word] = wid
+            id_to_word.append(word)
+        table[to_tuple(prefix)].append(wid)
+        push(wid)
+    return table, id_to_word
+
+def generate_text(table, n, word_count, id_to_word):
     '''
     Generates a list of words using a prefix-suffix hash table.
-    The process starts with a NONWORD prefix and 
+    The process starts with a NONWORD prefix and
     randomly selects a suffix
     Parameters:
-        table (hastable): A prefix-suffix hash table.
+        table (defaultdict): A prefix-suffix table keyed by id tuples.
          n (int): The prefix size.
         word_count (int): Number of words to generate.
+        id_to_word (list): Mapping from word ids back to words.
     Returns:
         tlist (list): the generated words list
     '''
 
-    tlist = []
-    prefix = [NONWORD] * n
-    prefix_str = ' '.join(prefix)
-    while prefix_str in table and len(tlist) < word_count:
-        suffixes = table.get(prefix_str)
+    tlist = [None] * word_count
+    count = 0
+    prefix = deque([0] * n, maxlen=n)
+    push = prefix.append
+    to_tuple = tuple
+    rand = randrange
+    prefix_key = to_tuple(prefix)
+    while prefix_key in table and count < word_count:
+        suffixes = table[prefix_key]
         if len(suffixes) > 1:
-            i = randint(0, len(suffixes) - 1)
-            right_word = suffixes[i]
+            right_id = suffixes[rand(len(suffixes))]
         else:
-            right_word = suffixes[0]
-        tlist.append(right_word)
-        prefix.pop(0)
-        prefix.append(right_word)
-        prefix_str = ' '.join(prefix)
-    return tlist
+            right_id = suffixes[0]
+        tlist[count] = id_to_word[right_id]
+        count += 1
+        push(right_id)
+        prefix_key = to_tuple(prefix)
+    return tlist[:count]
 
 def main():
     """
@@ -190,10 +200,14 @@ def main():
         sys.exit(0)
 
     contents = read_file(filename)
-    table = build_prefix_suffix_table(contents, prefix_size, table_size)
-    text_generated = generate_text(table, prefix_size, word_count)
-
-    for i in range(0, len(text_generated), 10):
-        print(' '.join(text_generated[i:i+10]))
+    table, id_to_word = build_prefix_suffix_table(contents, prefix_size,
+                                                  table_size)
+    text_generated = generate_text(table, prefix_size, word_count,
+                                   id_to_word)
+
+    lines = [' '.join(text_generated[i:i+10])
+             for i in range(0, len(text_generated), 10)]
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
 
 main()